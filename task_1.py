@@ -1,47 +1,169 @@
 """Module providing a class implementing linked list."""
+import heapq
+import random
+import time
+import tracemalloc
+from array import array
+
 class Node:
     """Class implementing node of linked list"""
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None):
         self.data = data
         self.next = None
 
 
+class DoublyNode(Node):
+    """
+    Class implementing node of linked list with a link to the previous node and
+    links to the neighbouring nodes holding the same value
+    """
+    __slots__ = ('prev', 'prev_same', 'next_same')
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.prev = None
+        self.prev_same = None
+        self.next_same = None
+
+
+def _iterate_from(node):
+    """Function yielding the nodes of a chain starting at the given node"""
+    while node:
+        yield node
+        node = node.next
+
+
+def _precedes(key, reverse):
+    """Function returning a check whether node a must strictly precede node b"""
+    if key is None:
+        return (lambda a, b: a.data > b.data) if reverse else (lambda a, b: a.data < b.data)
+    if reverse:
+        return lambda a, b: key(a.data) > key(b.data)
+    return lambda a, b: key(a.data) < key(b.data)
+
+
+def _cut_run(head, precedes):
+    """Function detaching the sorted run starting at head; returns its tail and the next node"""
+    node = head
+    while node.next and not precedes(node.next, node):
+        node = node.next
+    next_node = node.next
+    node.next = None
+    return node, next_node
+
+
+def _merge_chains(p1, tail1, p2, tail2, precedes):
+    """Function implementing stable merge of two sorted chains; returns head and tail"""
+    if not p1:
+        return p2, tail2
+    if not p2:
+        return p1, tail1
+
+    if precedes(p2, p1):
+        head = p2
+        p2 = p2.next
+    else:
+        head = p1
+        p1 = p1.next
+
+    current = head
+    while p1 and p2:
+        if precedes(p2, p1):
+            current.next = p2
+            p2 = p2.next
+        else:
+            current.next = p1
+            p1 = p1.next
+        current = current.next
+
+    if p1:
+        current.next = p1
+        return head, tail1
+    current.next = p2
+    return head, tail2 if p2 else current
+
+
 class LinkedList:
     """Class implementing linked list"""
+    node_class = Node
+
     def __init__(self):
         self.head = None
+        self.tail = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Function implementing linked list creation from an iterable"""
+        llist = cls()
+        llist.extend(iterable)
+        return llist
+
+    def extend(self, iterable):
+        """Function implementing append of all items of an iterable to the end"""
+        tail = self.tail
+        added = 0
+        for data in iterable:
+            new_node = self.node_class(data)
+            if tail is None:
+                self.head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            added += 1
+        self.tail = tail
+        self.size += added
 
     def insert_at_beginning(self, data):
         """Function implementing insert into beginning of the linked list"""
-        new_node = Node(data)
+        new_node = self.node_class(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self.size += 1
 
     def insert_at_end(self, data):
         """Function implementing insert into the end of the linked list"""
-        new_node = Node(data)
+        new_node = self.node_class(data)
         if self.head is None:
             self.head = new_node
         else:
-            cur = self.head
-            while cur.next:
-                cur = cur.next
-            cur.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
+        self.size += 1
 
     def insert_after(self, prev_node: Node, data):
         """Function implementing insert after node of linked list"""
         if prev_node is None:
             print("Previous node doesn't exists.")
             return
-        new_node = Node(data)
+        new_node = self.node_class(data)
         new_node.next = prev_node.next
         prev_node.next = new_node
+        if prev_node is self.tail:
+            self.tail = new_node
+        self.size += 1
 
     def delete_node(self, key: int):
         """Function implementing deleting node of the linked list"""
         cur = self.head
         if cur and cur.data == key:
             self.head = cur.next
+            if self.head is None:
+                self.tail = None
+            self.size -= 1
             cur = None
             return
         prev = None
@@ -51,6 +173,9 @@ class LinkedList:
         if cur is None:
             return
         prev.next = cur.next
+        if cur is self.tail:
+            self.tail = prev
+        self.size -= 1
         cur = None
 
     def search_element(self, data: int) -> Node | None:
@@ -66,6 +191,7 @@ class LinkedList:
         """Function implementing linked list reversing"""
         prev = None
         current = self.head
+        self.tail = current
         while current:
             next_node = current.next
             current.next = prev
@@ -84,6 +210,9 @@ class LinkedList:
                 current = current.next
             new_node.next = current.next
             current.next = new_node
+        if new_node.next is None:
+            self.tail = new_node
+        self.size += 1
 
     def insertion_sort(self):
         """Function implementing insertion sort"""
@@ -95,6 +224,7 @@ class LinkedList:
             sorted_list.sorted_insert(current)
             current = next_node
         self.head = sorted_list.head
+        self.tail = sorted_list.tail
 
     def print_list(self):
         """Function implementing linked list printing"""
@@ -106,40 +236,730 @@ class LinkedList:
     def merge_sorted(self, other):
         """Function implementing merge of sorted lists"""
         merged_list = LinkedList()
-        p1 = self.head
-        p2 = other.head
-
-        if not p1:
-            merged_list.head = p2
-            return merged_list
-        if not p2:
-            merged_list.head = p1
-            return merged_list
-
-        if p1.data <= p2.data:
-            merged_list.head = p1
-            p1 = p1.next
+        merged_list.size = self.size + other.size
+        merged_list.head, merged_list.tail = _merge_chains(self.head, self.tail,
+                                                           other.head, other.tail,
+                                                           _precedes(None, False))
+
+        # Both source lists now share nodes with the merged one
+        for llist in (self, other):
+            if llist.head:
+                llist.tail = merged_list.tail
+                llist.size = sum(1 for _ in _iterate_from(llist.head))
+
+        return merged_list
+
+    def merge_sort(self, key=None, reverse=False):
+        """
+        Function implementing stable natural bottom-up merge sort. Every pass merges
+        pairs of neighbouring sorted runs by relinking nodes, using O(1) extra memory
+        """
+        precedes = _precedes(key, reverse)
+        while True:
+            head = tail = None
+            runs = 0
+            current = self.head
+            while current:
+                first_head = current
+                first_tail, current = _cut_run(first_head, precedes)
+                second_head = current
+                second_tail = None
+                if second_head:
+                    second_tail, current = _cut_run(second_head, precedes)
+
+                run_head, run_tail = _merge_chains(first_head, first_tail,
+                                                   second_head, second_tail, precedes)
+                if tail is None:
+                    head = run_head
+                else:
+                    tail.next = run_head
+                tail = run_tail
+                runs += 1
+
+            self.head, self.tail = head, tail
+            if runs <= 1:
+                return
+
+    @classmethod
+    def merge_many(cls, lists, key=None):
+        """
+        Function implementing k-way merge of sorted lists through a heap.
+        Nodes are relinked into the result and the input lists are left empty
+        """
+        lists = list(lists)
+        key = key or (lambda data: data)
+        merged_list = cls()
+        heap = [(key(llist.head.data), index, llist.head)
+                for index, llist in enumerate(lists) if llist.head]
+        heapq.heapify(heap)
+
+        tail = None
+        while heap:
+            _, index, node = heap[0]
+            if node.next:
+                heapq.heapreplace(heap, (key(node.next.data), index, node.next))
+            else:
+                heapq.heappop(heap)
+            if tail is None:
+                merged_list.head = node
+            else:
+                tail.next = node
+            tail = node
+        if tail:
+            tail.next = None
+        merged_list.tail = tail
+
+        for llist in lists:
+            merged_list.size += llist.size
+            llist.head = llist.tail = None
+            llist.size = 0
+        return merged_list
+
+class IndexedLinkedList(LinkedList):
+    """
+    Class implementing linked list with a hash index from value to its nodes and
+    links to previous nodes, so search_element and delete_node take O(1).
+    With duplicate values the first node in list order is found and deleted first
+    """
+    node_class = DoublyNode
+
+    def __init__(self):
+        super().__init__()
+        self.index = {}  # value -> [first, last] node of its same-value chain
+
+    def _add_to_index(self, node):
+        """
+        Function registering a linked node in the value index. Nodes with the same
+        value are chained in list order; inserts at the head or the tail take O(1),
+        others walk to the nearest neighbour with the same value
+        """
+        bounds = self.index.get(node.data)
+        if bounds is None:
+            node.prev_same = node.next_same = None
+            self.index[node.data] = [node, node]
+            return
+
+        before = after = None
+        if node.prev is None:
+            after = bounds[0]
+        elif node.next is None:
+            before = bounds[1]
         else:
-            merged_list.head = p2
-            p2 = p2.next
+            back, forward = node.prev, node.next
+            while True:
+                if back is None:
+                    after = bounds[0]
+                    break
+                if back.data == node.data:
+                    before = back
+                    break
+                if forward is None:
+                    before = bounds[1]
+                    break
+                if forward.data == node.data:
+                    after = forward
+                    break
+                back, forward = back.prev, forward.next
 
-        current = merged_list.head
-        while p1 and p2:
-            if p1.data <= p2.data:
-                current.next = p1
-                p1 = p1.next
+        if before is None:
+            before = after.prev_same
+        else:
+            after = before.next_same
+        node.prev_same, node.next_same = before, after
+        if before is None:
+            bounds[0] = node
+        else:
+            before.next_same = node
+        if after is None:
+            bounds[1] = node
+        else:
+            after.prev_same = node
+
+    def _remove_from_index(self, node):
+        """Function unlinking a node from its same-value chain"""
+        bounds = self.index[node.data]
+        if node.prev_same is None:
+            bounds[0] = node.next_same
+        else:
+            node.prev_same.next_same = node.next_same
+        if node.next_same is None:
+            bounds[1] = node.prev_same
+        else:
+            node.next_same.prev_same = node.prev_same
+        if bounds[0] is None:
+            del self.index[node.data]
+        node.prev_same = node.next_same = None
+
+    def _link_neighbours(self, node):
+        """Function fixing the previous links around a newly linked node"""
+        if node.next:
+            node.next.prev = node
+        self._add_to_index(node)
+
+    def _rebuild_prev(self):
+        """Function restoring the previous links and the value index after nodes were relinked"""
+        self.index = {}
+        prev = None
+        for node in _iterate_from(self.head):
+            node.prev = prev
+            bounds = self.index.get(node.data)
+            if bounds is None:
+                node.prev_same = None
+                self.index[node.data] = [node, node]
             else:
-                current.next = p2
-                p2 = p2.next
-            current = current.next
+                node.prev_same = bounds[1]
+                bounds[1].next_same = node
+                bounds[1] = node
+            node.next_same = None
+            prev = node
 
-        if p1:
-            current.next = p1
-        if p2:
-            current.next = p2
+    def extend(self, iterable):
+        """Function implementing append of all items of an iterable to the end"""
+        for data in iterable:
+            self.insert_at_end(data)
+
+    def insert_at_beginning(self, data):
+        """Function implementing insert into beginning of the linked list"""
+        super().insert_at_beginning(data)
+        self.head.prev = None
+        self._link_neighbours(self.head)
+
+    def insert_at_end(self, data):
+        """Function implementing insert into the end of the linked list"""
+        prev = self.tail
+        super().insert_at_end(data)
+        self.tail.prev = prev
+        self._add_to_index(self.tail)
+
+    def insert_after(self, prev_node: Node, data):
+        """Function implementing insert after node of linked list"""
+        super().insert_after(prev_node, data)
+        if prev_node is not None:
+            prev_node.next.prev = prev_node
+            self._link_neighbours(prev_node.next)
+
+    def sorted_insert(self, new_node):
+        """Function implementing sorted insert of a DoublyNode"""
+        if not isinstance(new_node, DoublyNode):
+            raise TypeError("IndexedLinkedList.sorted_insert expects a DoublyNode")
+        super().sorted_insert(new_node)
+        new_node.prev = None
+        if new_node is not self.head:
+            # sorted_insert linked it right after the last smaller node
+            prev = self.head
+            while prev.next is not new_node:
+                prev = prev.next
+            new_node.prev = prev
+        self._link_neighbours(new_node)
+
+    def delete_node(self, key: int):
+        """Function implementing deleting node of the linked list"""
+        bounds = self.index.get(key)
+        if bounds is None:
+            return
+        node = bounds[0]
+        self._remove_from_index(node)
+
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        self.size -= 1
+
+    def search_element(self, data: int) -> Node | None:
+        """Function implementing search element of the linked list"""
+        bounds = self.index.get(data)
+        return bounds[0] if bounds else None
+
+    def reverse(self):
+        """Function implementing linked list reversing"""
+        super().reverse()
+        self._rebuild_prev()
+
+    def insertion_sort(self):
+        """Function implementing insertion sort"""
+        super().insertion_sort()
+        self._rebuild_prev()
+
+    def merge_sort(self, key=None, reverse=False):
+        """Function implementing stable natural bottom-up merge sort"""
+        super().merge_sort(key, reverse)
+        self._rebuild_prev()
+
+    def merge_sorted(self, other):
+        """
+        Function implementing merge of sorted lists into a new indexed list;
+        nodes are copied so that the indexes of both lists stay valid
+        """
+        return IndexedLinkedList.from_iterable(heapq.merge(self, other))
+
+    @classmethod
+    def merge_many(cls, lists, key=None):
+        """Function implementing k-way merge of sorted lists into a new indexed list"""
+        return cls.from_iterable(heapq.merge(*lists, key=key))
+
+
+class SkipNode:
+    """Class implementing node of skip list"""
+    __slots__ = ('data', 'forward')
+
+    def __init__(self, data, level):
+        self.data = data
+        self.forward = [None] * level
+
+    @property
+    def next(self):
+        """Next node on the bottom level"""
+        return self.forward[0]
+
+
+class SkipList:
+    """
+    Class implementing sorted linked list with express lanes: every node is on the
+    bottom level and on each higher level with probability 1/2, giving O(log n)
+    expected search, insert and delete
+    """
+    max_level = 32
 
+    def __init__(self):
+        self.header = SkipNode(None, self.max_level)
+        self.level = 1
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.header.forward[0]
+        while current:
+            yield current.data
+            current = current.forward[0]
+
+    @property
+    def head(self):
+        """First node of the list"""
+        return self.header.forward[0]
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Function implementing skip list creation from an iterable"""
+        skip_list = cls()
+        for data in iterable:
+            skip_list.sorted_insert(data)
+        return skip_list
+
+    def _predecessors(self, data):
+        """Function finding on every level the last node with a smaller value"""
+        update = [self.header] * self.max_level
+        current = self.header
+        for level in range(self.level - 1, -1, -1):
+            while current.forward[level] and current.forward[level].data < data:
+                current = current.forward[level]
+            update[level] = current
+        return update
+
+    def sorted_insert(self, data):
+        """Function implementing sorted insert"""
+        update = self._predecessors(data)
+        level = 1
+        while level < self.max_level and random.random() < 0.5:
+            level += 1
+        self.level = max(self.level, level)
+
+        new_node = SkipNode(data, level)
+        for i in range(level):
+            new_node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = new_node
+        self.size += 1
+
+    def search_element(self, data: int) -> SkipNode | None:
+        """Function implementing search element of the skip list"""
+        candidate = self._predecessors(data)[0].forward[0]
+        return candidate if candidate and candidate.data == data else None
+
+    def delete_node(self, key: int):
+        """Function implementing deleting node of the skip list"""
+        update = self._predecessors(key)
+        node = update[0].forward[0]
+        if node is None or node.data != key:
+            return
+        for i, next_node in enumerate(node.forward):
+            update[i].forward[i] = next_node
+        while self.level > 1 and self.header.forward[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+
+    def print_list(self):
+        """Function implementing skip list printing"""
+        for data in self:
+            print(data)
+
+
+NIL = -1
+
+
+class PooledLinkedList:
+    """
+    Class implementing linked list stored in a pool of parallel arrays: a node is an
+    index into data and next, and deleted slots are reused through a free-list
+    """
+    def __init__(self):
+        self.data = []
+        self.next = array('q')
+        self.head = NIL
+        self.tail = NIL
+        self.free = NIL
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current != NIL:
+            yield self.data[current]
+            current = self.next[current]
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Function implementing linked list creation from an iterable"""
+        llist = cls()
+        llist.extend(iterable)
+        return llist
+
+    def _allocate(self, data):
+        """Function taking a slot from the free-list or growing the pool"""
+        if self.free != NIL:
+            index = self.free
+            self.free = self.next[index]
+            self.data[index] = data
+            self.next[index] = NIL
+        else:
+            index = len(self.data)
+            self.data.append(data)
+            self.next.append(NIL)
+        self.size += 1
+        return index
+
+    def extend(self, iterable):
+        """Function implementing append of all items of an iterable to the end"""
+        for data in iterable:
+            self.insert_at_end(data)
+
+    def insert_at_beginning(self, data):
+        """Function implementing insert into beginning of the linked list"""
+        new_node = self._allocate(data)
+        self.next[new_node] = self.head
+        self.head = new_node
+        if self.tail == NIL:
+            self.tail = new_node
+
+    def insert_at_end(self, data):
+        """Function implementing insert into the end of the linked list"""
+        new_node = self._allocate(data)
+        if self.head == NIL:
+            self.head = new_node
+        else:
+            self.next[self.tail] = new_node
+        self.tail = new_node
+
+    def insert_after(self, prev_node: int, data):
+        """Function implementing insert after node of linked list"""
+        if prev_node is None or prev_node == NIL:
+            print("Previous node doesn't exists.")
+            return
+        new_node = self._allocate(data)
+        self.next[new_node] = self.next[prev_node]
+        self.next[prev_node] = new_node
+        if prev_node == self.tail:
+            self.tail = new_node
+
+    def delete_node(self, key: int):
+        """Function implementing deleting node of the linked list"""
+        prev = NIL
+        cur = self.head
+        while cur != NIL and self.data[cur] != key:
+            prev = cur
+            cur = self.next[cur]
+        if cur == NIL:
+            return
+
+        if prev == NIL:
+            self.head = self.next[cur]
+        else:
+            self.next[prev] = self.next[cur]
+        if cur == self.tail:
+            self.tail = prev
+        self.data[cur] = None
+        self.next[cur] = self.free
+        self.free = cur
+        self.size -= 1
+
+    def search_element(self, data: int) -> int | None:
+        """Function implementing search element of the linked list"""
+        cur = self.head
+        while cur != NIL:
+            if self.data[cur] == data:
+                return cur
+            cur = self.next[cur]
+        return None
+
+    def reverse(self):
+        """Function implementing linked list reversing"""
+        prev = NIL
+        current = self.head
+        self.tail = current
+        while current != NIL:
+            next_node = self.next[current]
+            self.next[current] = prev
+            prev = current
+            current = next_node
+        self.head = prev
+
+    def _insert_sorted(self, node):
+        """Function linking a detached node index in front of the first node not smaller"""
+        if self.head == NIL or self.data[self.head] >= self.data[node]:
+            self.next[node] = self.head
+            self.head = node
+        else:
+            current = self.head
+            while self.next[current] != NIL and self.data[self.next[current]] < self.data[node]:
+                current = self.next[current]
+            self.next[node] = self.next[current]
+            self.next[current] = node
+        if self.next[node] == NIL:
+            self.tail = node
+
+    def sorted_insert(self, data):
+        """Function implementing sorted insert; returns the index of the new node"""
+        new_node = self._allocate(data)
+        self._insert_sorted(new_node)
+        return new_node
+
+    def insertion_sort(self):
+        """Function implementing insertion sort by relinking the nodes in place"""
+        current = self.head
+        self.head = self.tail = NIL
+        while current != NIL:
+            next_node = self.next[current]
+            self._insert_sorted(current)
+            current = next_node
+
+    def _precedes(self, key, reverse):
+        """Function returning a check whether node index a must strictly precede node index b"""
+        data = self.data
+        if key is None:
+            key = lambda value: value
+        if reverse:
+            return lambda a, b: key(data[a]) > key(data[b])
+        return lambda a, b: key(data[a]) < key(data[b])
+
+    def _cut_run(self, head, precedes):
+        """Function detaching the sorted run starting at head; returns its tail and the next node"""
+        node = head
+        while self.next[node] != NIL and not precedes(self.next[node], node):
+            node = self.next[node]
+        next_node = self.next[node]
+        self.next[node] = NIL
+        return node, next_node
+
+    def _merge_chains(self, p1, tail1, p2, tail2, precedes):
+        """Function implementing stable merge of two sorted index chains; returns head and tail"""
+        if p1 == NIL:
+            return p2, tail2
+        if p2 == NIL:
+            return p1, tail1
+
+        if precedes(p2, p1):
+            head = p2
+            p2 = self.next[p2]
+        else:
+            head = p1
+            p1 = self.next[p1]
+
+        current = head
+        while p1 != NIL and p2 != NIL:
+            if precedes(p2, p1):
+                self.next[current] = p2
+                p2 = self.next[p2]
+            else:
+                self.next[current] = p1
+                p1 = self.next[p1]
+            current = self.next[current]
+
+        if p1 != NIL:
+            self.next[current] = p1
+            return head, tail1
+        self.next[current] = p2
+        return head, tail2 if p2 != NIL else current
+
+    def merge_sort(self, key=None, reverse=False):
+        """
+        Function implementing stable natural bottom-up merge sort. Every pass merges
+        pairs of neighbouring sorted runs by relinking node indexes, using O(1) extra memory
+        """
+        precedes = self._precedes(key, reverse)
+        while True:
+            head = tail = NIL
+            runs = 0
+            current = self.head
+            while current != NIL:
+                first_head = current
+                first_tail, current = self._cut_run(first_head, precedes)
+                second_head, second_tail = current, NIL
+                if second_head != NIL:
+                    second_tail, current = self._cut_run(second_head, precedes)
+
+                run_head, run_tail = self._merge_chains(first_head, first_tail,
+                                                        second_head, second_tail, precedes)
+                if tail == NIL:
+                    head = run_head
+                else:
+                    self.next[tail] = run_head
+                tail = run_tail
+                runs += 1
+
+            self.head, self.tail = head, tail
+            if runs <= 1:
+                return
+
+    def _adopt(self, other):
+        """
+        Function moving the nodes of another pooled list into this pool as a detached
+        chain; returns its head and tail and leaves the other list empty. The arrays
+        of an empty pool are taken over as they are, otherwise values move into free slots
+        """
+        if other is self:
+            raise ValueError("A pooled list can't adopt itself")
+        if not self.data:
+            self.data, self.next, self.free = other.data, other.next, other.free
+            head, tail = other.head, other.tail
+            self.size += other.size
+        else:
+            head = tail = NIL
+            for data in other:
+                node = self._allocate(data)
+                if tail == NIL:
+                    head = node
+                else:
+                    self.next[tail] = node
+                tail = node
+        other.data, other.next = [], array('q')
+        other.head = other.tail = other.free = NIL
+        other.size = 0
+        return head, tail
+
+    def merge_sorted(self, other):
+        """
+        Function implementing merge of sorted lists. The nodes of this list are relinked
+        in place and the values of the other list move into this pool, leaving it empty.
+        Returns this list
+        """
+        other_head, other_tail = self._adopt(other)
+        self.head, self.tail = self._merge_chains(self.head, self.tail, other_head, other_tail,
+                                                  self._precedes(None, False))
+        return self
+
+    @classmethod
+    def merge_many(cls, lists, key=None):
+        """
+        Function implementing k-way merge of sorted lists through a heap. The nodes
+        are moved into one pool and relinked into the result; the input lists are left empty
+        """
+        key = key or (lambda data: data)
+        merged_list = cls()
+        chains = [merged_list._adopt(llist) for llist in lists]
+        data, next_nodes = merged_list.data, merged_list.next
+        heap = [(key(data[head]), index, head)
+                for index, (head, _) in enumerate(chains) if head != NIL]
+        heapq.heapify(heap)
+
+        tail = NIL
+        while heap:
+            _, index, node = heap[0]
+            if next_nodes[node] != NIL:
+                heapq.heapreplace(heap, (key(data[next_nodes[node]]), index, next_nodes[node]))
+            else:
+                heapq.heappop(heap)
+            if tail == NIL:
+                merged_list.head = node
+            else:
+                next_nodes[tail] = node
+            tail = node
+        if tail != NIL:
+            next_nodes[tail] = NIL
+        merged_list.tail = tail
         return merged_list
 
+    def print_list(self):
+        """Function implementing linked list printing"""
+        for data in self:
+            print(data)
+
+
+def memory_report(n=10**6):
+    """Function measuring memory and throughput of the node and pooled backends"""
+    report = {}
+    for backend in (LinkedList, PooledLinkedList):
+        tracemalloc.start()
+        start = time.perf_counter()
+        llist = backend.from_iterable(range(n))
+        build_time = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for _ in llist:
+            pass
+        iterate_time = time.perf_counter() - start
+
+        report[backend.__name__] = {
+            "bytes_per_element": peak_memory / n,
+            "build_per_second": n / build_time,
+            "iterate_per_second": n / iterate_time,
+        }
+    return report
+
+def benchmark_build(n=10**6):
+    """Function measuring the time of building an n-element list in different ways"""
+    timings = {}
+
+    start = time.perf_counter()
+    llist = LinkedList()
+    for i in range(n):
+        llist.insert_at_end(i)
+    timings["insert_at_end"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    LinkedList().extend(range(n))
+    timings["extend"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    LinkedList.from_iterable(range(n))
+    timings["from_iterable"] = time.perf_counter() - start
+
+    return timings
+
+def benchmark_sort(n=2000):
+    """Function comparing insertion sort and merge sort on differently ordered inputs"""
+    inputs = {
+        "random": random.sample(range(n), n),
+        "sorted": list(range(n)),
+        "reverse-sorted": list(range(n, 0, -1)),
+    }
+    timings = {}
+    for name, values in inputs.items():
+        for method in ("insertion_sort", "merge_sort"):
+            llist = LinkedList.from_iterable(values)
+            start = time.perf_counter()
+            getattr(llist, method)()
+            timings[(name, method)] = time.perf_counter() - start
+    return timings
+
 if __name__ == "__main__":
 
     # Creating first list
@@ -1,5 +1,10 @@
 """Module providing a function drawing Pythagoras Tree Fractal."""
 import turtle
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+BRANCH_SCALE = 0.7
 
 def draw_tree(t, branch_length, level, angle):
     """Function drawing Pythagoras Tree Fractal."""
@@ -14,7 +19,7 @@ def draw_tree(t, branch_length, level, angle):
 
     # Draw the right branch
     t.right(angle)
-    draw_tree(t, branch_length * 0.7, level - 1, angle)
+    draw_tree(t, branch_length * BRANCH_SCALE, level - 1, angle)
 
     # Restore the turtle position and heading for the left branch
     t.setposition(current_pos)
@@ -22,25 +27,64 @@ def draw_tree(t, branch_length, level, angle):
 
     # Draw the left branch
     t.left(angle)
-    draw_tree(t, branch_length * 0.7, level - 1, angle)
+    draw_tree(t, branch_length * BRANCH_SCALE, level - 1, angle)
 
     # Restore the initial position and heading
     t.setposition(current_pos)
     t.setheading(current_heading)
 
+def tree_segments(branch_length, level, angle, start=(0, -250), heading=90):
+    """
+    Compute all branch segments of the Pythagoras Tree Fractal level by level,
+    without a turtle. Returns an array of shape (2**level - 1, 2, 2) holding
+    the start and end point of every branch.
+    """
+    points = np.array([start], dtype=np.float64)
+    headings = np.array([heading], dtype=np.float64)
+    segments = []
+
+    for _ in range(level):
+        radians = np.radians(headings)
+        ends = points + branch_length * np.column_stack([np.cos(radians), np.sin(radians)])
+        segments.append(np.stack([points, ends], axis=1))
+
+        # Every branch splits into a right and a left one starting at its end
+        points = np.repeat(ends, 2, axis=0)
+        headings = np.column_stack([headings - angle, headings + angle]).ravel()
+        branch_length *= BRANCH_SCALE
+
+    return np.concatenate(segments) if segments else np.zeros((0, 2, 2))
+
+def render_tree(segments, output_file, line_width=0.5):
+    """Render the segments in one batch as a LineCollection and save them to a PNG/SVG file."""
+    figure = Figure(figsize=(8, 8))
+    axes = figure.add_subplot()
+    axes.add_collection(LineCollection(segments, linewidths=line_width, colors='black'))
+    axes.set_aspect('equal')
+    axes.autoscale()
+    axes.axis('off')
+    figure.savefig(output_file)
+
 def main():
     """Main module function"""
+    # Initial parameters
+    initial_branch_length = 100
+    recursion_level = int(input("Enter recursion level: "))
+    initial_angle = 30
+    output_file = input("Enter output file (leave empty for live turtle preview): ").strip()
+
+    if output_file:
+        segments = tree_segments(initial_branch_length, recursion_level, initial_angle)
+        render_tree(segments, output_file)
+        print(f"Saved {len(segments)} branches to {output_file}")
+        return
+
     # Initialize screen and turtle
     screen = turtle.Screen()
     screen.title("Pythagoras Tree Fractal")
     t = turtle.Turtle()
     t.speed(0)  # Maximum speed
 
-    # Initial parameters
-    initial_branch_length = 100
-    recursion_level = int(input("Enter recursion level: "))
-    initial_angle = 30
-
     # Initial turtle position
     t.penup()
     t.goto(0, -250)
@@ -1,9 +1,13 @@
 """Module providing functions building tree from heap"""
 import heapq
+import os
 import uuid
 from matplotlib import pylab
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+LABEL_NODE_LIMIT = 15
 
 class Node:
     """Class implementing node"""
@@ -15,34 +19,135 @@ class Node:
         self.color = color  # Additional argument to store the node color
         self.id = str(uuid.uuid4())  # Unique identifier for each node
 
-def add_edges(graph, node, pos, x=0, y=0, layer=1):
-    """Recursively add edges and nodes to the graph for visualization."""
-    if node is not None:
-        graph.add_node(node.id, color=node.color, label=node.val)  # Use id and store node value
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2 ** layer
-            pos[node.left.id] = (l, y - 1)
-            l = add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2 ** layer
-            pos[node.right.id] = (r, y - 1)
-            r = add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
-    return graph
-
-def draw_tree(tree_root, colors=None, isDelay=False, window_title="Heap tree visualization"):
-    """Draw the binary tree using matplotlib and networkx."""
+class HeapTreeView:
+    """
+    Class implementing a binary tree view over a heap array. The children of
+    index i are 2i+1 and 2i+2; nodes are lightweight proxies created on demand.
+    """
+    def __init__(self, heap, color="skyblue"):
+        """Initialize the view over a heap list without copying it."""
+        self.heap = heap
+        self.color = color
+        self.layouts = {}  # (root index, max_levels) -> (heap size, graph, pos)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def node(self, index):
+        """Return the node proxy at the given heap index, or None past the end."""
+        return HeapNode(self, index) if 0 <= index < len(self.heap) else None
+
+    @property
+    def root(self):
+        """Root node proxy of the tree."""
+        return self.node(0)
+
+class HeapNode:
+    """Class implementing a node proxy of HeapTreeView with the Node interface"""
+    __slots__ = ('tree', 'index')
+
+    def __init__(self, tree, index):
+        """Initialize a proxy for the element at index of the tree's heap."""
+        self.tree = tree
+        self.index = index
+
+    @property
+    def id(self):
+        """Integer identifier of the node, its heap index."""
+        return self.index
+
+    @property
+    def val(self):
+        """Value stored in the heap at the node index."""
+        return self.tree.heap[self.index]
+
+    @property
+    def color(self):
+        """Color of the node."""
+        return self.tree.color
+
+    @property
+    def left(self):
+        """Left child proxy, or None."""
+        return self.tree.node(2 * self.index + 1)
+
+    @property
+    def right(self):
+        """Right child proxy, or None."""
+        return self.tree.node(2 * self.index + 2)
+
+    def __eq__(self, other):
+        return isinstance(other, HeapNode) and self.tree is other.tree \
+            and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.tree), self.index))
+
+def tree_layout(tree_root, max_levels=None):
+    """
+    Compute the structure and positions of the tree iteratively: x is the in-order
+    rank of a node and y minus its depth, so spacing never collapses. Only the
+    top max_levels levels are included when given. Returns (graph, pos, nodes),
+    where nodes maps ids to tree nodes so values and colors are read at draw time.
+    Layouts of heap views are cached on the view for its current heap size.
+    """
+    view = tree_root.tree if isinstance(tree_root, HeapNode) else None
+    if view is not None:
+        key = (tree_root.id, max_levels)
+        size, tree, pos = view.layouts.get(key, (None, None, None))
+        if size == len(view):
+            return tree, pos, {node_id: view.node(node_id) for node_id in tree.nodes}
+
     tree = nx.DiGraph()
-    pos = {tree_root.id: (0, 0)}
-    tree = add_edges(tree, tree_root, pos)
+    pos = {}
+    nodes = {}
+    stack = []
+    node, depth, rank = tree_root, 0, 0
+    while True:
+        while node and (max_levels is None or depth < max_levels):
+            stack.append((node, depth))
+            node, depth = node.left, depth + 1
+        if not stack:
+            break
+        node, depth = stack.pop()
+        tree.add_node(node.id)
+        nodes[node.id] = node
+        pos[node.id] = (rank, -depth)
+        rank += 1
+        if max_levels is None or depth + 1 < max_levels:
+            for child in (node.left, node.right):
+                if child:
+                    tree.add_edge(node.id, child.id)
+        node, depth = node.right, depth + 1
+
+    if view is not None:
+        view.layouts[key] = (len(view), tree, pos)
+    return tree, pos, nodes
+
+def draw_tree(tree_root, colors=None, isDelay=False, window_title="Heap tree visualization",
+              max_levels=None, output_file=None):
+    """
+    Draw the binary tree using matplotlib and networkx. Pass a subtree node as
+    tree_root or max_levels to draw only part of a large tree. With output_file
+    (e.g. .png or .svg) the figure is rendered headlessly and saved instead.
+    """
+    tree, pos, nodes = tree_layout(tree_root, max_levels)
 
-    node_colors = [colors[node[0]] if colors and node[0] in colors \
-                   else node[1]['color'] for node in tree.nodes(data=True)]
-    labels = {node[0]: node[1]['label'] for node in tree.nodes(data=True)}
+    node_colors = [colors[node_id] if colors and node_id in colors \
+                   else nodes[node_id].color for node_id in tree.nodes]
+    labels = {node_id: nodes[node_id].val for node_id in tree.nodes}
+    small = tree.number_of_nodes() <= LABEL_NODE_LIMIT
+    options = {'labels': labels if small else None, 'with_labels': small, 'arrows': False,
+               'node_size': 2500 if small else 20, 'node_color': node_colors}
+
+    if output_file:
+        figure = Figure(figsize=(8, 5))
+        nx.draw(tree, pos=pos, ax=figure.add_subplot(), **options)
+        figure.savefig(output_file)
+        return
 
     plt.figure(window_title, figsize=(8, 5))
-    nx.draw(tree, pos=pos, labels=labels, arrows=False, node_size=2500, node_color=node_colors)
+    nx.draw(tree, pos=pos, **options)
     if isDelay:
         plt.show(block=False)
         plt.pause(1)
@@ -50,23 +155,28 @@ def draw_tree(tree_root, colors=None, isDelay=False, window_title="Heap tree vis
     else:
         plt.show()
 
+def render_trees(trees, directory, file_format="png", max_levels=None):
+    """
+    Render several trees headlessly, one file per {name: tree_root} entry,
+    and return the paths of the written files.
+    """
+    paths = []
+    for name, tree_root in trees.items():
+        path = os.path.join(directory, f"{name}.{file_format}")
+        draw_tree(tree_root, max_levels=max_levels, output_file=path)
+        paths.append(path)
+    return paths
+
 
 def build_heap_tree(heap):
-    """Build a binary tree from a binary heap for visualization."""
+    """
+    Build a binary tree from a binary heap for visualization. The tree is a view
+    over the heap list itself, so no node objects are allocated up front.
+    """
     if not heap:
         return None
 
-    nodes = [Node(val) for val in heap]
-
-    for i, node in enumerate(nodes):
-        left_index = 2 * i + 1
-        right_index = 2 * i + 2
-        if left_index < len(nodes):
-            node.left = nodes[left_index]
-        if right_index < len(nodes):
-            node.right = nodes[right_index]
-
-    return nodes[0]  # Root of the heap tree
+    return HeapTreeView(heap).root  # Root of the heap tree
 
 
 def main():
@@ -1,7 +1,7 @@
 """Module providing binary tree traversing"""
 import heapq
 from collections import deque
-from task_4 import draw_tree, build_heap_tree
+from task_4 import HeapNode, draw_tree, build_heap_tree
 
 def get_color_gradient(n):
     """Generate a list of colors transitioning from dark to light."""
@@ -20,7 +20,7 @@ def dfs_visualization(root):
     stack = [root]
     order = []
     colors = {}
-    node_count = sum(1 for _ in iterate_nodes(root))
+    node_count = count_nodes(root)
     color_gradient = get_color_gradient(node_count)
 
     colors[root.id] = color_gradient[0]
@@ -49,7 +49,7 @@ def bfs_visualization(root):
     queue = deque([root])
     order = []
     colors = {}
-    node_count = sum(1 for _ in iterate_nodes(root))
+    node_count = count_nodes(root)
     color_gradient = get_color_gradient(node_count)
 
     colors[root.id] = color_gradient[0]
@@ -71,13 +71,21 @@ def bfs_visualization(root):
         draw_tree(root, colors, isDelay=True, window_title="BFS tree visualization")
 
 def iterate_nodes(root):
-    """Generator to iterate over all nodes in the binary tree."""
-    if root:
-        yield root
-        if root.left:
-            yield from iterate_nodes(root.left)
-        if root.right:
-            yield from iterate_nodes(root.right)
+    """Generator to iterate over all nodes in the binary tree in pre-order."""
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+def count_nodes(root):
+    """Count the nodes of the binary tree; heap views know their size directly."""
+    if isinstance(root, HeapNode) and root.id == 0:
+        return len(root.tree)
+    return sum(1 for _ in iterate_nodes(root))
 
 def main():
     """
@@ -1,11 +1,20 @@
 """Module providing a functions solving Knapsack problem."""
+import random
+import time
+from bisect import bisect_right
+from itertools import accumulate
+import numpy as np
+
+def calories_ratio(item):
+    """Returns the calories to cost ratio of an (name, details) item."""
+    return item[1]['calories'] / item[1]['cost']
+
 def greedy_algorithm(items, budget):
     """
     Selects items maximizing the calories to cost ratio within a given 
     budget using a greedy algorithm.
     """
-    sorted_items = sorted(items.items(), \
-                          key=lambda x: x[1]['calories'] / x[1]['cost'], reverse=True)
+    sorted_items = sorted(items.items(), key=calories_ratio, reverse=True)
 
     total_cost = 0
     selected_items = []
@@ -17,37 +26,389 @@ def greedy_algorithm(items, budget):
 
     return selected_items
 
+def _calories_dtype(details_list):
+    """
+    Returns the table dtype for the items: int64 when all calories are integers,
+    float64 otherwise so fractional calories are not truncated.
+    """
+    if all(isinstance(details['calories'], (int, np.integer)) for details in details_list):
+        return np.int64
+    return np.float64
+
+def _dp_row(item_list, budget):
+    """
+    Returns the final row of the knapsack table (best calories for every budget
+    up to the given one) using a single array updated item by item.
+    """
+    dp = np.zeros(budget + 1, dtype=_calories_dtype(details for _, details in item_list))
+    for _, details in item_list:
+        cost, calories = details['cost'], details['calories']
+        if cost > budget:
+            continue
+        candidate = dp[:budget + 1 - cost] + calories
+        np.maximum(dp[cost:], candidate, out=dp[cost:])
+    return dp
+
+def max_calories(items, budget):
+    """
+    Computes the maximum calories reachable within the budget in O(budget) memory.
+    """
+    return _dp_row(list(items.items()), budget)[budget].item()
+
+def _add_item_row(dp, cost, calories):
+    """
+    Updates the knapsack row in place with one more item and returns the packed
+    bits marking the budgets where taking the item improved the row.
+    """
+    budget = dp.size - 1
+    taken = np.zeros(budget + 1, dtype=bool)
+    if cost <= budget:
+        candidate = dp[:budget + 1 - cost] + calories
+        taken[cost:] = candidate > dp[cost:]
+        taken[0] = False
+        dp[taken] = candidate[taken[cost:]]
+    return np.packbits(taken)
+
+def _reconstruct(item_list, decisions, budget):
+    """Walks the packed decisions backwards to recover the selected item names."""
+    selected_items = []
+    j = budget
+    for i in range(len(item_list) - 1, -1, -1):
+        if decisions[i][j >> 3] >> (7 - (j & 7)) & 1:
+            item, details = item_list[i]
+            selected_items.append(item)
+            j -= details['cost']
+
+    selected_items.reverse()
+    return selected_items
+
 def dynamic_programming(items, budget):
     """
     Computes the optimal set of items to maximize calories within a given 
-    budget using dynamic programming.
+    budget using dynamic programming. Only one table row is kept; the decisions
+    needed to reconstruct the selection are stored as packed bits.
     """
-    n = len(items)
     item_list = list(items.items())
+    dp = np.zeros(budget + 1, dtype=_calories_dtype(items.values()))
 
-    dp = [[0] * (budget + 1) for _ in range(n + 1)]
+    # Build the table row by row, remembering where each item improved it
+    decisions = [_add_item_row(dp, details['cost'], details['calories'])
+                 for _, details in item_list]
 
-    # Build the table in bottom-up manner
-    for i in range(1, n + 1):
-        item, details = item_list[i - 1]
-        cost, calories = details['cost'], details['calories']
-        for j in range(1, budget + 1):
-            if cost > j:
-                dp[i][j] = dp[i - 1][j]
-            else:
-                dp[i][j] = max(dp[i - 1][j], dp[i - 1][j - cost] + calories)
+    return _reconstruct(item_list, decisions, budget)
+
+class KnapsackCatalog:
+    """
+    Class answering knapsack queries for many budgets over one item catalog.
+    The table is built once up to max_budget; every query is served from the
+    final row, and items can be appended without recomputing the others.
+    """
+    def __init__(self, items, max_budget):
+        self.max_budget = max_budget
+        self.item_list = []
+        self.decisions = []
+        self.dp = np.zeros(max_budget + 1, dtype=_calories_dtype(items.values()))
+        for item, details in items.items():
+            self.add_item(item, details)
+
+    def add_item(self, item, details):
+        """Add an item to the catalog, updating the table with one row."""
+        self.item_list.append((item, details))
+        if _calories_dtype([details]) is np.float64 and self.dp.dtype == np.int64:
+            self.dp = self.dp.astype(np.float64)
+        self.decisions.append(_add_item_row(self.dp, details['cost'], details['calories']))
+
+    def max_calories(self, budget):
+        """Return the maximum calories reachable within the budget."""
+        self._check_budget(budget)
+        return self.dp[budget].item()
+
+    def select(self, budget):
+        """Return the optimal list of item names for the budget."""
+        self._check_budget(budget)
+        return _reconstruct(self.item_list, self.decisions, budget)
+
+    def _check_budget(self, budget):
+        """Raise ValueError when the budget is outside the precomputed table."""
+        if not 0 <= budget <= self.max_budget:
+            raise ValueError(f"Budget must be between 0 and {self.max_budget}.")
+
+def benchmark_catalog(items, max_budget, num_queries=10000, seed=None):
+    """
+    Measures the time to answer num_queries random budgets with KnapsackCatalog
+    against calling dynamic_programming for each budget.
+    """
+    rng = np.random.default_rng(seed)
+    budgets = rng.integers(0, max_budget + 1, size=num_queries).tolist()
+
+    start = time.perf_counter()
+    catalog = KnapsackCatalog(items, max_budget)
+    catalog_results = [catalog.select(budget) for budget in budgets]
+    catalog_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loop_results = [dynamic_programming(items, budget) for budget in budgets]
+    loop_time = time.perf_counter() - start
+
+    assert catalog_results == loop_results
+    return {"catalog": catalog_time, "loop": loop_time}
+
+def _hirschberg(item_list, budget):
+    """Recursively splits the items and the budget between two halves."""
+    if len(item_list) == 1:
+        item, details = item_list[0]
+        return [item] if details['cost'] <= budget and details['calories'] > 0 else []
+
+    middle = len(item_list) // 2
+    left_row = _dp_row(item_list[:middle], budget)
+    right_row = _dp_row(item_list[middle:], budget)
+    left_budget = int(np.argmax(left_row + right_row[::-1]))
+
+    return _hirschberg(item_list[:middle], left_budget) + \
+        _hirschberg(item_list[middle:], budget - left_budget)
+
+def hirschberg_knapsack(items, budget):
+    """
+    Computes an optimal set of items in O(budget) memory with Hirschberg-style
+    divide and conquer, at the cost of recomputing table rows.
+    """
+    if not items:
+        return []
+    return _hirschberg(list(items.items()), budget)
+
+def branch_and_bound(items, budget, node_limit=None, time_limit=None):
+    """
+    Computes the optimal set of items with depth-first branch and bound over the
+    items sorted by calories to cost ratio, pruning with the fractional knapsack
+    bound. When node_limit or time_limit (seconds) is hit, the best selection
+    found so far is returned.
+    """
+    sorted_items = sorted(items.items(), key=calories_ratio, reverse=True)
+    costs = [details['cost'] for _, details in sorted_items]
+    calories = [details['calories'] for _, details in sorted_items]
+    prefix_cost = [0, *accumulate(costs)]
+    prefix_calories = [0, *accumulate(calories)]
+    n = len(sorted_items)
+
+    def upper_bound(i, capacity):
+        """Best fractional value reachable from item i with the remaining capacity."""
+        target = prefix_cost[i] + capacity
+        k = bisect_right(prefix_cost, target, lo=i) - 1
+        value = prefix_calories[k] - prefix_calories[i]
+        if k < n:
+            value += (target - prefix_cost[k]) * calories[k] / costs[k]
+        return value
+
+    # Start from the greedy selection so there is always an answer to return
+    best_value, best_chosen, total_cost = 0, None, 0
+    for i in range(n):
+        if total_cost + costs[i] <= budget:
+            total_cost += costs[i]
+            best_value += calories[i]
+            best_chosen = (i, best_chosen)
+
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    stack = [(0, budget, 0, None)]  # (next item, remaining budget, value, chosen items)
+    nodes = 0
+
+    while stack:
+        nodes += 1
+        if node_limit is not None and nodes > node_limit:
+            break
+        if deadline is not None and nodes % 1024 == 0 and time.perf_counter() > deadline:
+            break
+
+        i, capacity, value, chosen = stack.pop()
+        if value > best_value:
+            best_value, best_chosen = value, chosen
+        if i == n or value + upper_bound(i, capacity) <= best_value:
+            continue
+
+        stack.append((i + 1, capacity, value, chosen))
+        if costs[i] <= capacity:
+            stack.append((i + 1, capacity - costs[i], value + calories[i], (i, chosen)))
+
+    selected = set()
+    while best_chosen is not None:
+        index, best_chosen = best_chosen
+        selected.add(sorted_items[index][0])
+
+    return [item for item in items if item in selected]
+
+def fractional_knapsack_bound(items, budget):
+    """
+    Computes the fractional knapsack optimum, an upper bound for the 0/1 problem,
+    in expected O(n) time by selecting the critical calories to cost ratio with
+    weighted-median partitioning instead of sorting.
+    """
+    candidates = [(calories_ratio(item), item[1]['cost'], item[1]['calories'])
+                  for item in items.items() if item[1]['cost'] > 0]
+    # Items that cost nothing always fit, so their calories are taken up front
+    value = sum(max(details['calories'], 0) for details in items.values()
+                if details['cost'] <= 0)
+    capacity = budget
+
+    while candidates:
+        pivot = random.choice(candidates)[0]
+        higher = [c for c in candidates if c[0] > pivot]
+        equal = [c for c in candidates if c[0] == pivot]
+        higher_cost = sum(cost for _, cost, _ in higher)
+
+        if higher_cost > capacity:
+            candidates = higher
+            continue
+        value += sum(calories for _, _, calories in higher)
+        capacity -= higher_cost
+
+        equal_cost = sum(cost for _, cost, _ in equal)
+        if equal_cost >= capacity:
+            return value + capacity * pivot
+        value += sum(calories for _, _, calories in equal)
+        capacity -= equal_cost
+        candidates = [c for c in candidates if c[0] < pivot]
+
+    return value
+
+def fptas_knapsack(items, budget, epsilon=0.1):
+    """
+    Selects items with at least (1 - epsilon) of the optimal calories. Calories are
+    rescaled so the table size depends on the number of items and 1/epsilon,
+    not on the budget. Returns the selected items, their calories and an upper
+    bound on the optimal calories.
+    """
+    item_list = [(item, details) for item, details in items.items()
+                 if details['cost'] <= budget and details['calories'] > 0]
+    if not item_list:
+        return [], 0, 0
+
+    scale = epsilon * max(details['calories'] for _, details in item_list) / len(item_list)
+    scaled = [int(details['calories'] // scale) for _, details in item_list]
+    total = sum(scaled)
+
+    # min_cost[v] is the cheapest way to reach a scaled value of exactly v
+    min_cost = np.full(total + 1, np.inf)
+    min_cost[0] = 0
+    decisions = []
+    for (_, details), value in zip(item_list, scaled):
+        candidate = min_cost[:total + 1 - value] + details['cost']
+        taken = np.zeros(total + 1, dtype=bool)
+        taken[value:] = candidate < min_cost[value:]
+        min_cost[taken] = candidate[taken[value:]]
+        decisions.append(np.packbits(taken))
+
+    v = int(np.flatnonzero(min_cost <= budget)[-1])
+    selected = set()
+    for i in range(len(item_list) - 1, -1, -1):
+        if decisions[i][v >> 3] >> (7 - (v & 7)) & 1:
+            selected.add(item_list[i][0])
+            v -= scaled[i]
+
+    selected_items = [item for item in items if item in selected]
+    calories = sum(items[item]['calories'] for item in selected_items)
+    upper_bound = min(calories / (1 - epsilon) if epsilon < 1 else float('inf'),
+                      fractional_knapsack_bound(items, budget))
+    return selected_items, calories, upper_bound
+
+def _split_quantity(quantity):
+    """Splits a quantity into powers of two (plus a remainder) covering 0..quantity."""
+    parts = []
+    power = 1
+    while quantity > 0:
+        part = min(power, quantity)
+        parts.append(part)
+        quantity -= part
+        power *= 2
+    return parts
+
+def bounded_knapsack(items, budget):
+    """
+    Computes the optimal multiset of items when every item may be taken up to
+    its 'quantity' (1 when missing) times. Quantities are split into binary
+    pieces, so the table grows with log(quantity) rather than quantity.
+    Returns the item names, repeated as many times as they are taken.
+    """
+    pieces = []
+    for item, details in items.items():
+        for count in _split_quantity(details.get('quantity', 1)):
+            pieces.append(((item, count), {'cost': details['cost'] * count,
+                                           'calories': details['calories'] * count}))
+
+    dp = np.zeros(budget + 1, dtype=_calories_dtype(details for _, details in pieces))
+    decisions = [_add_item_row(dp, details['cost'], details['calories'])
+                 for _, details in pieces]
 
     selected_items = []
-    j = budget
-    for i in range(n, 0, -1):
-        if dp[i][j] != dp[i - 1][j]:
-            item, _ = item_list[i - 1]
+    for item, count in _reconstruct(pieces, decisions, budget):
+        selected_items.extend([item] * count)
+    return selected_items
+
+def unbounded_knapsack(items, budget):
+    """
+    Computes the optimal multiset of items when every item may be taken any
+    number of times.
+    """
+    unbounded_items = {item: {**details, 'quantity': budget // details['cost']}
+                       for item, details in items.items() if details['cost'] > 0}
+    return bounded_knapsack(unbounded_items, budget)
+
+def two_constraint_knapsack(items, budget, weight_limit):
+    """
+    Computes the optimal set of items whose total cost fits the budget and
+    whose total 'weight' fits the weight limit.
+    """
+    item_list = list(items.items())
+    dp = np.zeros((budget + 1, weight_limit + 1), dtype=_calories_dtype(items.values()))
+    decisions = []
+
+    for _, details in item_list:
+        cost, weight, calories = details['cost'], details['weight'], details['calories']
+        taken = np.zeros(dp.shape, dtype=bool)
+        if cost <= budget and weight <= weight_limit:
+            candidate = dp[:budget + 1 - cost, :weight_limit + 1 - weight] + calories
+            taken[cost:, weight:] = candidate > dp[cost:, weight:]
+            taken[0, 0] = False
+            dp[cost:, weight:] = np.where(taken[cost:, weight:], candidate, dp[cost:, weight:])
+        decisions.append(np.packbits(taken))
+
+    selected_items = []
+    j, k = budget, weight_limit
+    for i in range(len(item_list) - 1, -1, -1):
+        bit = j * (weight_limit + 1) + k
+        if decisions[i][bit >> 3] >> (7 - (bit & 7)) & 1:
+            item, details = item_list[i]
             selected_items.append(item)
-            j -= items[item]['cost']
+            j -= details['cost']
+            k -= details['weight']
 
     selected_items.reverse()
     return selected_items
 
+def benchmark_variants(item_counts, budget, weight_limit, seed=None):
+    """
+    Measures how the knapsack variants scale with the number of items.
+    Returns {item_count: {solver: seconds}}.
+    """
+    rng = np.random.default_rng(seed)
+    results = {}
+    for count in item_counts:
+        items = {f"item-{i}": {"cost": int(rng.integers(1, 50)),
+                               "calories": int(rng.integers(1, 500)),
+                               "weight": int(rng.integers(1, 20)),
+                               "quantity": int(rng.integers(1, 1000))}
+                 for i in range(count)}
+        solvers = {
+            "dynamic_programming": lambda: dynamic_programming(items, budget),
+            "bounded": lambda: bounded_knapsack(items, budget),
+            "unbounded": lambda: unbounded_knapsack(items, budget),
+            "two_constraint": lambda: two_constraint_knapsack(items, budget, weight_limit),
+        }
+        results[count] = {}
+        for name, solver in solvers.items():
+            start = time.perf_counter()
+            solver()
+            results[count][name] = time.perf_counter() - start
+    return results
+
 if __name__ == "__main__":
     items = {
         "pizza": {"cost": 50, "calories": 300},
@@ -65,3 +426,23 @@ if __name__ == "__main__":
 
     dp_result = dynamic_programming(items, budget)
     print("Dynamic programming result:", dp_result)
+
+    hirschberg_result = hirschberg_knapsack(items, budget)
+    print("Hirschberg result:", hirschberg_result)
+
+    branch_and_bound_result = branch_and_bound(items, budget)
+    print("Branch and bound result:", branch_and_bound_result)
+
+    print("Unbounded result:", unbounded_knapsack(items, budget))
+
+    fptas_result, fptas_calories, fptas_bound = fptas_knapsack(items, budget, epsilon=0.2)
+    print(f"FPTAS result: {fptas_result} ({fptas_calories} calories, "
+          f"optimum at most {fptas_bound:.1f})")
+
+    timings = benchmark_catalog(items, budget)
+    print(f"10000 budget queries: catalog {timings['catalog']:.3f}s, "
+          f"dynamic_programming loop {timings['loop']:.3f}s")
+
+    for count, variant_timings in benchmark_variants([10, 100, 1000], 1000, 100).items():
+        print(f"{count} items: " + ", ".join(f"{name} {seconds:.3f}s"
+                                             for name, seconds in variant_timings.items()))
@@ -1,63 +1,261 @@
 """Module providing a functions to analyze Monte-Carlo method."""
-import random
+import json
+import math
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
 import matplotlib.pyplot as plt
 import numpy as np
 
-def monte_carlo_dice_simulation(num_rolls):
+CHUNK_SIZE = 1_000_000
+TWO_DICE = (6, 6)
+FFT_THRESHOLD = 100_000  # Number of possible sums above which FFT is used
+BATCH_SIZE = 100_000
+
+def roll_counts(num_rolls, rng, chunk_size=CHUNK_SIZE, dice=TWO_DICE):
+    """
+    Rolls the dice num_rolls times in fixed-size chunks and returns the counts
+    of every sum as an array indexed by the sum. Each entry of dice is the number
+    of faces of one die; memory is bounded by chunk_size, not by the number of dice.
+    """
+    counts = np.zeros(sum(dice) + 1, dtype=np.int64)
+    remaining = num_rolls
+
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        totals = np.zeros(size, dtype=np.int64)
+        for faces in dice:
+            totals += rng.integers(1, faces + 1, size=size)
+        counts += np.bincount(totals, minlength=counts.size)
+        remaining -= size
+
+    return counts
+
+def counts_to_probabilities(counts, num_rolls, dice=TWO_DICE):
+    """
+    Converts an array of sum counts into the {sum: probability} dictionary.
+    """
+    return {sum_: int(counts[sum_]) / num_rolls for sum_ in range(len(dice), sum(dice) + 1)}
+
+def monte_carlo_dice_simulation(num_rolls, seed=None, chunk_size=CHUNK_SIZE, dice=TWO_DICE):
+    """
+    Simulates rolling the dice a specified number of times using the Monte Carlo method.
+    Rolls are generated in chunks, so memory stays flat for any num_rolls,
+    and passing a seed makes the result reproducible.
+    """
+    rng = np.random.default_rng(seed)
+    counts = roll_counts(num_rolls, rng, chunk_size, dice)
+    return counts_to_probabilities(counts, num_rolls, dice)
+
+def _worker_counts(args):
+    """Rolls the dice share of a single worker with its own random stream."""
+    num_rolls, seed_sequence, chunk_size, dice = args
+    return roll_counts(num_rolls, np.random.default_rng(seed_sequence), chunk_size, dice)
+
+def parallel_dice_simulation(num_rolls, workers=None, seed=None, chunk_size=CHUNK_SIZE,
+                             dice=TWO_DICE, executor=None):
+    """
+    Simulates rolling the dice on a process pool. Every worker gets an independent
+    random stream spawned from one SeedSequence, so the result is deterministic
+    for a given seed and number of workers. An already running executor can be
+    passed to reuse its processes.
+    """
+    workers = workers or os.cpu_count() or 1
+    seed_sequences = np.random.SeedSequence(seed).spawn(workers)
+    shares = [num_rolls // workers + (1 if i < num_rolls % workers else 0)
+              for i in range(workers)]
+    tasks = [(share, seed_sequence, chunk_size, dice)
+             for share, seed_sequence in zip(shares, seed_sequences)]
+
+    if executor is not None:
+        counts = sum(executor.map(_worker_counts, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            counts = sum(executor.map(_worker_counts, tasks))
+
+    return counts_to_probabilities(counts, num_rolls, dice)
+
+def confidence_intervals(counts, num_rolls, confidence, dice=TWO_DICE):
+    """
+    Returns normal-approximation confidence intervals {sum: (low, high)}
+    for the probability of every sum.
+    """
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    intervals = {}
+    for sum_ in range(len(dice), sum(dice) + 1):
+        prob = int(counts[sum_]) / num_rolls
+        half_width = z * math.sqrt(prob * (1 - prob) / num_rolls)
+        intervals[sum_] = (max(0.0, prob - half_width), min(1.0, prob + half_width))
+    return intervals
+
+def adaptive_dice_simulation(rel_tolerance=0.001, confidence=0.99, batch_size=BATCH_SIZE,
+                             max_rolls=10**9, seed=None, dice=TWO_DICE):
+    """
+    Rolls the dice in batches until the confidence interval of every observed sum
+    is within rel_tolerance of its estimate, or max_rolls is reached.
+    Returns the probabilities, the achieved intervals and the number of rolls.
+    """
+    rng = np.random.default_rng(seed)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    counts = np.zeros(sum(dice) + 1, dtype=np.int64)
+    num_rolls = 0
+
+    while num_rolls < max_rolls:
+        size = min(batch_size, max_rolls - num_rolls)
+        counts += roll_counts(size, rng, batch_size, dice)
+        num_rolls += size
+
+        observed = counts[len(dice):]
+        observed = observed[observed > 0] / num_rolls
+        # Half width of the interval relative to the estimate, worst over all sums
+        max_rel_error = np.max(z * np.sqrt((1 - observed) / (observed * num_rolls)))
+        if max_rel_error <= rel_tolerance:
+            break
+
+    probabilities = counts_to_probabilities(counts, num_rolls, dice)
+    intervals = confidence_intervals(counts, num_rolls, confidence, dice)
+    return probabilities, intervals, num_rolls
+
+def stream_dice_simulation(snapshot_every, total_rolls=None, seed=None, checkpoint=None,
+                           dice=TWO_DICE):
+    """
+    Rolls the dice indefinitely (or up to total_rolls) and yields a snapshot every
+    snapshot_every rolls with the running probabilities, their errors against the
+    analytical probabilities and a JSON-serializable checkpoint. Passing a saved
+    checkpoint resumes the run exactly where it stopped.
+    """
+    rng = np.random.default_rng(seed)
+    if checkpoint is None:
+        counts = np.zeros(sum(dice) + 1, dtype=np.int64)
+        num_rolls = 0
+    else:
+        dice = tuple(checkpoint['dice'])
+        rng.bit_generator.state = checkpoint['rng_state']
+        counts = np.array(checkpoint['counts'], dtype=np.int64)
+        num_rolls = checkpoint['num_rolls']
+
+    analytical_probs = analytical_probabilities(dice)
+
+    while total_rolls is None or num_rolls < total_rolls:
+        size = snapshot_every if total_rolls is None else min(snapshot_every,
+                                                              total_rolls - num_rolls)
+        counts += roll_counts(size, rng, dice=dice)
+        num_rolls += size
+
+        probabilities = counts_to_probabilities(counts, num_rolls, dice)
+        yield {
+            'num_rolls': num_rolls,
+            'probabilities': probabilities,
+            'errors': calculate_errors(probabilities, analytical_probs),
+            'checkpoint': {
+                'dice': list(dice),
+                'num_rolls': num_rolls,
+                'counts': counts.tolist(),
+                'rng_state': rng.bit_generator.state,
+            },
+        }
+
+def save_checkpoint(checkpoint, path):
+    """Saves a streaming simulation checkpoint to a JSON file."""
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(checkpoint, file)
+
+def load_checkpoint(path):
+    """Loads a streaming simulation checkpoint from a JSON file."""
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+def measure_throughput(num_rolls, worker_counts, seed=None):
     """
-    Simulates rolling two dice a specified number of times using the Monte Carlo method.
+    Runs the parallel simulation for every number of workers and returns
+    (rolls per second, pool startup seconds) per number of workers. The pool
+    is started and warmed up with empty tasks before the rolls are timed.
     """
-    sums_count = {i: 0 for i in range(2, 13)}
+    throughput = {}
+    for workers in worker_counts:
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            warm_up = [(0, np.random.SeedSequence(), CHUNK_SIZE, TWO_DICE)] * workers
+            list(executor.map(_worker_counts, warm_up))
+            startup = time.perf_counter() - start
+
+            start = time.perf_counter()
+            parallel_dice_simulation(num_rolls, workers, seed, executor=executor)
+            throughput[workers] = (num_rolls / (time.perf_counter() - start), startup)
+    return throughput
 
-    for _ in range(num_rolls):
-        roll1 = random.randint(1, 6)
-        roll2 = random.randint(1, 6)
-        roll_sum = roll1 + roll2
-        sums_count[roll_sum] += 1
+MAX_TICKS = 30
 
-    probabilities = {sum_: count / num_rolls for sum_, count in sums_count.items()}
-    return probabilities
+def _tick_step(num_sums):
+    """Returns the step between labelled ticks so that the axis stays readable."""
+    return max(1, -(-num_sums // MAX_TICKS))
 
 def plot_probabilities(probabilities, title):
     """
-    Plots the probabilities of the sums of two dice rolls.
+    Plots the probabilities of the sums of the dice rolls.
     """
     sums = list(probabilities.keys())
     probs = list(probabilities.values())
 
     plt.bar(sums, probs, color='skyblue')
-    plt.xlabel('Sum of Two Dice')
+    plt.xlabel('Sum of Dice')
     plt.ylabel('Probability')
     plt.title(title)
-    plt.xticks(sums)
+    plt.xticks(sums[::_tick_step(len(sums))])
     plt.ylim(0, max(probs) * 1.2)
     plt.show()
 
-def analytical_probabilities():
-    """
-    Returns the analytical probabilities for the sums of two dice rolls.
-    """
-    probabilities = {
-        2: 1/36,
-        3: 2/36,
-        4: 3/36,
-        5: 4/36,
-        6: 5/36,
-        7: 6/36,
-        8: 5/36,
-        9: 4/36,
-        10: 3/36,
-        11: 2/36,
-        12: 1/36
-    }
-    return probabilities
+def _fft_sum_distribution(dice):
+    """
+    Computes the distribution of the sum of the dice as a product of the
+    face distributions in the frequency domain. The result is approximate:
+    probabilities in the tails below about 1e-16 are lost in rounding noise.
+    """
+    size = sum(dice) - len(dice) + 1
+    spectrum = np.ones(size // 2 + 1, dtype=complex)
+    for faces, count in Counter(dice).items():
+        spectrum *= np.fft.rfft(np.full(faces, 1 / faces), size) ** count
+    return np.clip(np.fft.irfft(spectrum, size), 0, None)
+
+def _power_distribution(distribution, count):
+    """
+    Computes the distribution of the sum of count independent draws by
+    convolution with repeated squaring, using O(log count) convolutions.
+    """
+    result = np.ones(1)
+    while count:
+        if count & 1:
+            result = np.convolve(result, distribution)
+        count >>= 1
+        if count:
+            distribution = np.convolve(distribution, distribution)
+    return result
+
+def analytical_probabilities(dice=TWO_DICE):
+    """
+    Returns the analytical probabilities for the sums of the dice rolls,
+    computed by convolving the face distributions of all dice. The result is
+    exact to floating-point precision; only supports larger than FFT_THRESHOLD
+    sums switch to the approximate FFT product.
+    """
+    if sum(dice) - len(dice) + 1 > FFT_THRESHOLD:
+        distribution = _fft_sum_distribution(dice)
+    else:
+        distribution = np.ones(1)
+        for faces, count in Counter(dice).items():
+            distribution = np.convolve(distribution,
+                                       _power_distribution(np.full(faces, 1 / faces), count))
+
+    return {len(dice) + i: float(prob) for i, prob in enumerate(distribution)}
 
 def compare_probabilities(monte_carlo_probs, analytical_probs):
     """
     Compares Monte Carlo probabilities with analytical probabilities by plotting them together.
     """
     sums = list(analytical_probs.keys())
-    monte_carlo = [monte_carlo_probs[sum_] for sum_ in sums]
+    monte_carlo = [monte_carlo_probs.get(sum_, 0) for sum_ in sums]
     analytical = [analytical_probs[sum_] for sum_ in sums]
 
     bar_width = 0.35
@@ -65,20 +263,22 @@ def compare_probabilities(monte_carlo_probs, analytical_probs):
 
     plt.bar(index, monte_carlo, bar_width, label='Monte Carlo', color='skyblue')
     plt.bar(index + bar_width, analytical, bar_width, label='Analytical', color='orange')
-    
-    plt.xlabel('Sum of Two Dice')
+
+    step = _tick_step(len(sums))
+    plt.xlabel('Sum of Dice')
     plt.ylabel('Probability')
     plt.title('Comparison of Monte Carlo and Analytical Probabilities')
-    plt.xticks(index + bar_width / 2, sums)
+    plt.xticks(index[::step] + bar_width / 2, sums[::step])
     plt.legend()
     plt.show()
 
 def calculate_errors(monte_carlo_probs, analytical_probs):
     """
     Calculates the errors between Monte Carlo probabilities and analytical probabilities.
+    Sums with zero analytical probability have no relative error and are skipped.
     """
-    errors = {sum_: abs(monte_carlo_probs[sum_] - analytical_probs[sum_]) / analytical_probs[sum_]\
-               * 100 for sum_ in analytical_probs}
+    errors = {sum_: abs(monte_carlo_probs.get(sum_, 0) - an_prob) / an_prob * 100
+              for sum_, an_prob in analytical_probs.items() if an_prob > 0}
     return errors
 
 def print_summary(monte_carlo_probs, analytical_probs, errors):
@@ -87,8 +287,8 @@ def print_summary(monte_carlo_probs, analytical_probs, errors):
     """
     print("Sum | Monte Carlo Probability | Analytical Probability | Error (%)")
     print("----|-------------------------|-------------------------|----------")
-    for sum_ in sorted(monte_carlo_probs.keys()):
-        mc_prob = monte_carlo_probs[sum_]
+    for sum_ in sorted(errors.keys()):
+        mc_prob = monte_carlo_probs.get(sum_, 0)
         an_prob = analytical_probs[sum_]
         error = errors[sum_]
         print(f"{sum_:>3} | {mc_prob:>23.4f} | {an_prob:>23.4f} | {error:>8.2f}")
@@ -99,7 +299,7 @@ def print_summary(monte_carlo_probs, analytical_probs, errors):
 def main():
     """Main function presenting analyze"""
     num_rolls = 1000000
-    monte_carlo_probs = monte_carlo_dice_simulation(num_rolls)
+    monte_carlo_probs = parallel_dice_simulation(num_rolls)
     analytical_probs = analytical_probabilities()
     errors = calculate_errors(monte_carlo_probs, analytical_probs)
 
@@ -117,6 +317,18 @@ def main():
 
     print_summary(monte_carlo_probs, analytical_probs, errors)
 
+    _, intervals, adaptive_rolls = adaptive_dice_simulation(rel_tolerance=0.01)
+    print(f"\nAdaptive run reached 1% relative error at 99% confidence "
+          f"after {adaptive_rolls:,} rolls:")
+    for sum_, (low, high) in intervals.items():
+        print(f"Sum {sum_}: [{low:.4f}, {high:.4f}]")
+
+    print("\nThroughput:")
+    for workers, (rolls_per_second, startup) in measure_throughput(num_rolls * 10,
+                                                                   [1, 2, 4]).items():
+        print(f"{workers} worker(s): {rolls_per_second:,.0f} rolls/s "
+              f"(pool startup {startup:.3f} s)")
+
     plot_probabilities(monte_carlo_probs, "Monte Carlo Probabilities for Dice Rolls")
     compare_probabilities(monte_carlo_probs, analytical_probs)
 